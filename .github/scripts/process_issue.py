@@ -7,13 +7,39 @@ Converts approved GitHub issues into JSON data and creates pull requests
 import argparse
 from datetime import datetime
 import json
+import math
 import os
 import re
 import sys
 import uuid
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 import urllib.parse
 
+# Prefer orjson for faster JSON load/save; fall back to the stdlib
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Precompiled patterns for issue body parsing
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9_]')
+_MULTI_NL_RE = re.compile(r'\n\s*\n\s*\n+')
+_WS_RE = re.compile(r'[ \t]+')
+
+# Case-folded "No response" placeholder emitted by GitHub issue forms
+_NO_RESPONSE = frozenset({"no response"})
+
 
 def load_json_file(filename: str) -> List[Dict[str, Any]]:
     """Load JSON file safely"""
@@ -21,8 +47,8 @@ def load_json_file(filename: str) -> List[Dict[str, Any]]:
         return []
     
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filename, 'rb') as f:
+            return _loads(f.read())
     except (json.JSONDecodeError, FileNotFoundError):
         print(f"Error reading {filename}. Starting with empty list.")
         return []
@@ -30,8 +56,55 @@ def load_json_file(filename: str) -> List[Dict[str, Any]]:
 
 def save_json_file(filename: str, data: List[Dict[str, Any]]) -> None:
     """Save JSON file with proper formatting"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(filename, 'wb') as f:
+        f.write(_dumps(data))
+
+
+def _last_non_space(f, pos: int) -> Tuple[int, bytes]:
+    """Find the last non-whitespace byte before pos in a binary file"""
+    while pos > 0:
+        pos -= 1
+        f.seek(pos)
+        ch = f.read(1)
+        if not ch.isspace():
+            return pos, ch
+    return -1, b''
+
+
+def append_json_file(filename: str, item: Dict[str, Any]) -> None:
+    """Append an item to a JSON array file without rewriting existing entries"""
+    entry = _dumps(item).replace(b'\n', b'\n  ')
+    
+    try:
+        with open(filename, 'rb+') as f:
+            end, ch = _last_non_space(f, f.seek(0, os.SEEK_END))
+            prev, prev_ch = _last_non_space(f, end)
+            
+            # Splice the new entry in before the closing bracket
+            if ch == b']' and prev_ch in (b'}', b'['):
+                f.seek(end)
+                closing = f.read()  # keep the bracket and any trailing newline
+                separator = b',\n  ' if prev_ch == b'}' else b'\n  '
+                f.seek(prev + 1)
+                f.truncate()
+                f.write(separator + entry + b'\n' + closing)
+                return
+    except FileNotFoundError:
+        pass
+    
+    # Fall back to a full rewrite for missing or unexpectedly formatted files
+    data = load_json_file(filename)
+    data.append(item)
+    save_json_file(filename, data)
+
+
+def _to_float(value: str, default: Optional[float] = 0.0) -> Optional[float]:
+    """Parse a finite float, returning default if empty or invalid"""
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return default
+    return number if math.isfinite(number) else default
 
 
 def generate_uuid() -> str:
@@ -39,79 +112,69 @@ def generate_uuid() -> str:
     return str(uuid.uuid4())
 
 
-def parse_issue_body(issue_body: str) -> Dict[str, str]:
-    """Parse GitHub issue body and extract form data"""
-    data = {}
-    
-    # Split the issue body into sections based on ### headers
-    sections = re.split(r'\n### ', issue_body)
+def _store_issue_field(data: Dict[str, str], field_name: str, content_lines: List[str]) -> None:
+    """Normalize one form section and store it if it has content"""
+    field_content = '\n'.join(content_lines).strip()
     
-    for section in sections:
-        section = section.strip()
-        if not section:
-            continue
-            
-        # Handle the first section which might not have ### stripped
-        if section.startswith('###'):
-            section = section[3:].strip()
+    # Skip empty content
+    if not field_content:
+        return
         
-        lines = section.split('\n', 1)  # Split into header and content
-        if len(lines) < 2:
-            continue
-            
-        field_name = lines[0].strip()
-        field_content = lines[1].strip() if len(lines) > 1 else ""
-        
-        # Skip empty content
-        if not field_content:
-            continue
-            
-        # Clean up field name for consistent mapping
-        field_key = field_name.lower().replace(' ', '_').replace('(', '').replace(')', '').replace('/', '_')
-        field_key = re.sub(r'[^a-z0-9_]', '', field_key)
-        
-        # Handle checkbox fields (- [x] format)
-        if field_content.startswith('- [x]'):
-            field_content = field_content[5:].strip()
+    # Clean up field name for consistent mapping
+    field_key = field_name.lower().replace(' ', '_').replace('(', '').replace(')', '').replace('/', '_')
+    field_key = _NON_ALNUM_RE.sub('', field_key)
+    
+    # Handle checkbox fields (- [x] format)
+    if field_content.startswith('- [x]'):
+        field_content = field_content[5:].strip()
+    
+    # Stop at comment sections or end-of-form markers
+    field_content = field_content.partition('<!-- ')[0].strip()
         
-        # Stop at comment sections or end-of-form markers
-        if '<!-- ' in field_content:
-            field_content = field_content.split('<!-- ')[0].strip()
-            
-        # Store the field data
-        if field_content and field_key:
-            data[field_key] = field_content
+    # Store the field data (values are kept stripped, so callers needn't re-strip)
+    if field_content and field_key:
+        data[field_key] = field_content
+
+
+def parse_issue_body(issue_body: str) -> Dict[str, str]:
+    """Parse GitHub issue body and extract form data"""
+    data = {}
+    field_name = None
+    content_lines = []
+    
+    # Single pass over the body: every "### " line starts a new section
+    for line in issue_body.splitlines():
+        if line.startswith('### '):
+            if field_name is not None:
+                _store_issue_field(data, field_name, content_lines)
+            field_name = line[4:].strip()
+            content_lines = []
+        elif field_name is not None:
+            content_lines.append(line)
+    
+    if field_name is not None:
+        _store_issue_field(data, field_name, content_lines)
     
     return data
 
 
 def clean_no_response(text: str) -> Optional[str]:
     """Clean up 'No response' placeholders from GitHub forms"""
-    if not text or not text.strip():
+    cleaned = text.strip() if text else ""
+    if not cleaned:
         return None
     
-    cleaned = text.strip()
-    
     # Handle various "No response" formats from GitHub forms
-    no_response_patterns = [
-        "_No response_",
-        "No response", 
-        "_no response_",
-        "no response",
-        "_No Response_",
-        "No Response"
-    ]
-    
-    if cleaned in no_response_patterns:
+    if cleaned.casefold().strip('_ ') in _NO_RESPONSE:
         return None
     
     # Normalize whitespace and newlines for better JSON output
     # Replace multiple consecutive newlines with double newlines
-    cleaned = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned)
+    cleaned = _MULTI_NL_RE.sub('\n\n', cleaned)
     # Clean up extra whitespace but preserve intentional line breaks
-    cleaned = re.sub(r'[ \t]+', ' ', cleaned)
+    cleaned = _WS_RE.sub(' ', cleaned)
     
-    return cleaned.strip() if cleaned.strip() else None
+    return cleaned.strip() or None
 
 
 def process_film_stock_issue(issue_data: Dict[str, str]) -> Dict[str, Any]:
@@ -120,9 +183,9 @@ def process_film_stock_issue(issue_data: Dict[str, str]) -> Dict[str, Any]:
     # Map form fields to JSON structure
     film_stock = {
         "id": generate_uuid(),
-        "brand": issue_data.get("brandmanufacturer", "").strip(),
-        "name": issue_data.get("film_name", "").strip(),
-        "isoSpeed": float(issue_data.get("iso_speed", "0")) if issue_data.get("iso_speed", "").replace(".", "").isdigit() else 0.0,
+        "brand": issue_data.get("brandmanufacturer", ""),
+        "name": issue_data.get("film_name", ""),
+        "isoSpeed": _to_float(issue_data.get("iso_speed", "0")),
         "colorType": convert_color_type(issue_data.get("film_type", "")),
         "grainStructure": clean_no_response(issue_data.get("grain_structure", "")),
         "reciprocityFailure": clean_no_response(issue_data.get("reciprocity_failure_characteristics", "")),
@@ -141,10 +204,10 @@ def process_developer_issue(issue_data: Dict[str, str]) -> Dict[str, Any]:
     
     developer = {
         "id": generate_uuid(),
-        "name": issue_data.get("developer_name", "").strip(),
-        "manufacturer": issue_data.get("manufacturer", "").strip(),
-        "type": issue_data.get("developer_type", "").strip(),
-        "filmOrPaper": issue_data.get("intended_use", "").strip(),
+        "name": issue_data.get("developer_name", ""),
+        "manufacturer": issue_data.get("manufacturer", ""),
+        "type": issue_data.get("developer_type", ""),
+        "filmOrPaper": issue_data.get("intended_use", ""),
         "workingLifeHours": parse_numeric_field(issue_data.get("working_life_hours", "")),
         "stockLifeMonths": parse_numeric_field(issue_data.get("stock_life_months", "")),
         "discontinued": 1 if "discontinued" in issue_data.get("current_production_status", "").lower() else 0,
@@ -158,43 +221,43 @@ def process_developer_issue(issue_data: Dict[str, str]) -> Dict[str, Any]:
     return developer
 
 
-def process_combination_issue(issue_data: Dict[str, str], film_stocks: List[Dict[str, Any]], developers: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+def process_combination_issue(issue_data: Dict[str, str], film_index: Dict[Tuple[str, str], str], developer_index: Dict[Tuple[str, str], Tuple[Optional[str], Dict[str, int]]]) -> Optional[Dict[str, Any]]:
     """Convert issue data to development combination JSON format"""
     
     # Find matching film stock
-    film_brand = issue_data.get("film_brand", "").strip()
-    film_name = issue_data.get("film_name", "").strip()
-    filmStockId = find_film_stock_id(film_stocks, film_brand, film_name)
+    film_brand = issue_data.get("film_brand", "")
+    film_name = issue_data.get("film_name", "")
+    filmStockId = find_film_stock_id(film_index, film_brand, film_name)
     
     if not filmStockId:
         print(f"Warning: Could not find film stock: {film_brand} {film_name}")
         return None
     
     # Find matching developer
-    developer_manufacturer = issue_data.get("developer_manufacturer", "").strip()
-    developer_name = issue_data.get("developer_name", "").strip()
-    developer_id, dilution_id = find_developer_and_dilution(developers, developer_manufacturer, developer_name, issue_data.get("dilution_name", ""))
+    developer_manufacturer = issue_data.get("developer_manufacturer", "")
+    developer_name = issue_data.get("developer_name", "")
+    developer_id, dilution_id = find_developer_and_dilution(developer_index, developer_manufacturer, developer_name, issue_data.get("dilution_name", ""))
     
     if not developer_id:
         print(f"Warning: Could not find developer: {developer_manufacturer} {developer_name}")
         return None
     
     # Parse push/pull stops
-    push_pull_str = issue_data.get("push_pull_stops", "0").strip()
+    push_pull_str = issue_data.get("push_pull_stops", "0")
     push_pull = parse_push_pull(push_pull_str)
     
     combination = {
         "id": generate_uuid(),
-        "name": issue_data.get("combination_name", "").strip(),
+        "name": issue_data.get("combination_name", ""),
         "filmStockId": filmStockId,
         "developerId": developer_id,
         "dilutionId": dilution_id,
-        "customDilution": None if dilution_id else issue_data.get("dilution_name", "").strip(),
+        "customDilution": None if dilution_id else issue_data.get("dilution_name", ""),
         "temperatureF": int(float(issue_data.get("temperature_f", "68"))),
         "timeMinutes": float(issue_data.get("time_minutes", "0")),
         "shootingIso": float(issue_data.get("shooting_iso", "0")),
         "pushPull": push_pull,
-        "agitationSchedule": issue_data.get("agitation_schedule", "").strip(),
+        "agitationSchedule": issue_data.get("agitation_schedule", ""),
         "notes": clean_no_response(issue_data.get("notes", ""))
     }
     
@@ -225,13 +288,8 @@ def parse_manufacturer_notes(notes_text: str) -> List[str]:
 
 def parse_numeric_field(field_value: str) -> Optional[int]:
     """Parse numeric field, return None if empty or invalid"""
-    if not field_value.strip():
-        return None
-    
-    try:
-        return int(float(field_value.strip()))
-    except ValueError:
-        return None
+    number = _to_float(field_value, None)
+    return int(number) if number is not None else None
 
 
 def parse_urls(urls_text: str) -> List[str]:
@@ -270,75 +328,81 @@ def parse_dilutions(dilutions_text: str) -> List[Dict[str, Any]]:
     return dilutions
 
 
-def find_film_stock_id(film_stocks: List[Dict[str, Any]], brand: str, name: str) -> Optional[str]:
-    """Find film stock ID by brand and name"""
+def build_film_index(film_stocks: List[Dict[str, Any]]) -> Dict[Tuple[str, str], str]:
+    """Index film stock IDs by lowercased brand and name"""
+    index = {}
     for film in film_stocks:
-        if (film.get("brand", "").lower() == brand.lower() and 
-            film.get("name", "").lower() == name.lower()):
-            return film.get("id")
-    return None
+        index.setdefault((film.get("brand", "").lower(), film.get("name", "").lower()), film.get("id"))
+    return index
 
 
-def find_developer_and_dilution(developers: List[Dict[str, Any]], manufacturer: str, name: str, dilution_name: str) -> Tuple[Optional[str], Optional[int]]:
-    """Find developer ID and dilution ID"""
+def build_developer_index(developers: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Tuple[Optional[str], Dict[str, int]]]:
+    """Index developer IDs and their dilution IDs by lowercased manufacturer and name"""
+    index = {}
     for dev in developers:
-        if (dev.get("manufacturer", "").lower() == manufacturer.lower() and 
-            dev.get("name", "").lower() == name.lower()):
-            
-            developer_id = dev.get("id")
-            
-            # Find dilution ID if specified
-            dilution_id = None
-            if dilution_name and "dilutions" in dev:
-                for dilution in dev.get("dilutions", []):
-                    if (dilution.get("name", "").lower() == dilution_name.lower() or
-                        dilution.get("dilution", "").lower() == dilution_name.lower()):
-                        dilution_id = dilution.get("id")
-                        break
-            
-            return developer_id, dilution_id
+        key = (dev.get("manufacturer", "").lower(), dev.get("name", "").lower())
+        if key in index:
+            continue
+        
+        # Dilutions can be matched by either their name or their ratio
+        dilutions = {}
+        for dilution in dev.get("dilutions") or []:
+            dilutions.setdefault(dilution.get("name", "").lower(), dilution.get("id"))
+            dilutions.setdefault(dilution.get("dilution", "").lower(), dilution.get("id"))
+        
+        index[key] = (dev.get("id"), dilutions)
+    return index
+
+
+def find_film_stock_id(film_index: Dict[Tuple[str, str], str], brand: str, name: str) -> Optional[str]:
+    """Find film stock ID by brand and name"""
+    return film_index.get((brand.lower(), name.lower()))
+
+
+def find_developer_and_dilution(developer_index: Dict[Tuple[str, str], Tuple[Optional[str], Dict[str, int]]], manufacturer: str, name: str, dilution_name: str) -> Tuple[Optional[str], Optional[int]]:
+    """Find developer ID and dilution ID"""
+    entry = developer_index.get((manufacturer.lower(), name.lower()))
+    if entry is None:
+        return None, None
+    
+    developer_id, dilutions = entry
     
-    return None, None
+    # Find dilution ID if specified
+    dilution_id = dilutions.get(dilution_name.lower()) if dilution_name else None
+    
+    return developer_id, dilution_id
 
 
 def parse_push_pull(push_pull_str: str) -> int:
     """Parse push/pull string to integer"""
-    if not push_pull_str.strip():
-        return 0
-    
-    # Remove + and spaces, handle negative
-    clean_str = push_pull_str.strip().replace('+', '')
-    
-    try:
-        return int(float(clean_str))
-    except ValueError:
-        return 0
+    # Remove + signs; float() handles surrounding spaces and negatives
+    return int(_to_float(push_pull_str.replace('+', '')))
 
 
-def check_for_duplicates(new_item: Dict[str, Any], existing_items: List[Dict[str, Any]], item_type: str) -> bool:
-    """Check if item already exists in database"""
+def duplicate_key(item: Dict[str, Any], item_type: str) -> Optional[Tuple]:
+    """Build the identity key used to detect duplicate entries"""
     if item_type == "film_stock":
-        for item in existing_items:
-            if (item.get("brand", "").lower() == new_item.get("brand", "").lower() and
-                item.get("name", "").lower() == new_item.get("name", "").lower()):
-                return True
+        return (item.get("brand", "").lower(), item.get("name", "").lower())
     
     elif item_type == "developer":
-        for item in existing_items:
-            if (item.get("manufacturer", "").lower() == new_item.get("manufacturer", "").lower() and
-                item.get("name", "").lower() == new_item.get("name", "").lower()):
-                return True
+        return (item.get("manufacturer", "").lower(), item.get("name", "").lower())
     
     elif item_type == "combination":
-        for item in existing_items:
-            if (item.get("filmStockId") == new_item.get("filmStockId") and
-                item.get("developerId") == new_item.get("developerId") and
-                item.get("dilutionId") == new_item.get("dilutionId") and
-                item.get("shootingIso") == new_item.get("shootingIso") and
-                item.get("pushPull") == new_item.get("pushPull")):
-                return True
+        return (item.get("filmStockId"), item.get("developerId"), item.get("dilutionId"),
+                item.get("shootingIso"), item.get("pushPull"))
     
-    return False
+    return None
+
+
+def build_duplicate_index(existing_items: List[Dict[str, Any]], item_type: str) -> Set[Tuple]:
+    """Collect the identity keys of existing items into a set for membership tests"""
+    return {duplicate_key(item, item_type) for item in existing_items}
+
+
+def check_for_duplicates(new_item: Dict[str, Any], existing_keys: Set[Tuple], item_type: str) -> bool:
+    """Check if item already exists in database"""
+    key = duplicate_key(new_item, item_type)
+    return key is not None and key in existing_keys
 
 
 def main():
@@ -362,11 +426,16 @@ def main():
     developers = load_json_file(os.path.join(args.output_dir, 'developers.json'))
     combinations = load_json_file(os.path.join(args.output_dir, 'development_combinations.json'))
     
+    # Identity keys of existing entries, so each duplicate check is a set lookup
+    film_keys = build_duplicate_index(film_stocks, 'film_stock')
+    dev_keys = build_duplicate_index(developers, 'developer')
+    combo_keys = build_duplicate_index(combinations, 'combination')
+    
     # Process based on issue type
     if args.issue_type == 'film-stock':
         new_item = process_film_stock_issue(issue_data)
         
-        if check_for_duplicates(new_item, film_stocks, 'film_stock'):
+        if check_for_duplicates(new_item, film_keys, 'film_stock'):
             print(f"Error: Film stock '{new_item['brand']} {new_item['name']}' already exists")
             sys.exit(1)
         
@@ -374,14 +443,13 @@ def main():
             print("Film Stock Data:")
             print(json.dumps(new_item, indent=2))
         else:
-            film_stocks.append(new_item)
-            save_json_file(os.path.join(args.output_dir, 'film_stocks.json'), film_stocks)
+            append_json_file(os.path.join(args.output_dir, 'film_stocks.json'), new_item)
             print(f"Added film stock: {new_item['brand']} {new_item['name']}")
     
     elif args.issue_type == 'developer':
         new_item = process_developer_issue(issue_data)
         
-        if check_for_duplicates(new_item, developers, 'developer'):
+        if check_for_duplicates(new_item, dev_keys, 'developer'):
             print(f"Error: Developer '{new_item['manufacturer']} {new_item['name']}' already exists")
             sys.exit(1)
         
@@ -389,18 +457,17 @@ def main():
             print("Developer Data:")
             print(json.dumps(new_item, indent=2))
         else:
-            developers.append(new_item)
-            save_json_file(os.path.join(args.output_dir, 'developers.json'), developers)
+            append_json_file(os.path.join(args.output_dir, 'developers.json'), new_item)
             print(f"Added developer: {new_item['manufacturer']} {new_item['name']}")
     
     elif args.issue_type == 'combination':
-        new_item = process_combination_issue(issue_data, film_stocks, developers)
+        new_item = process_combination_issue(issue_data, build_film_index(film_stocks), build_developer_index(developers))
         
         if not new_item:
             print("Error: Could not create combination (missing film or developer)")
             sys.exit(1)
         
-        if check_for_duplicates(new_item, combinations, 'combination'):
+        if check_for_duplicates(new_item, combo_keys, 'combination'):
             print(f"Error: Combination '{new_item['name']}' already exists")
             sys.exit(1)
         
@@ -408,8 +475,7 @@ def main():
             print("Combination Data:")
             print(json.dumps(new_item, indent=2))
         else:
-            combinations.append(new_item)
-            save_json_file(os.path.join(args.output_dir, 'development_combinations.json'), combinations)
+            append_json_file(os.path.join(args.output_dir, 'development_combinations.json'), new_item)
             print(f"Added combination: {new_item['name']}")
 
 
@@ -5,23 +5,37 @@ client.py
 Main client class for the Dorkroom Static API.
 """
 
+import heapq
 import json
 import logging
-from functools import lru_cache
-from typing import Any, Callable, Dict, List, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
-from urllib.parse import urljoin
 from urllib3.util.retry import Retry
 
 from .types import Film, Developer, Combination
 from .exceptions import DataFetchError, DataParseError, DataNotLoadedError
 from .protocols import HTTPTransport
 
+# Data files published by the API, in load order
+_DATA_FILES = ("film_stocks.json", "developers.json", "development_combinations.json")
+
+# Leave log output configuration to the application
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Try orjson for faster JSON parsing
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Try rapidfuzz for fuzzy matching
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
     FUZZY_AVAILABLE = True
 except ImportError:
     FUZZY_AVAILABLE = False
@@ -33,6 +47,7 @@ class DorkroomClient:
     This client provides methods to fetch film stocks, developers, and 
     development combinations from the Dorkroom Static API. It features:
     - Automatic retries and timeouts
+    - Keep-alive connection reuse across fetches (default transport)
     - Indexed lookups for O(1) performance
     - Optional fuzzy searching
     - Comprehensive error handling
@@ -43,6 +58,7 @@ class DorkroomClient:
         session: Configured requests session
         transport: HTTP transport (for dependency injection)
         logger: Logger instance
+        cache_dir: Directory for cached payloads, or None if disabled
     """
     
     def __init__(
@@ -52,6 +68,7 @@ class DorkroomClient:
         max_retries: int = 3,
         transport: HTTPTransport = None,
         logger: Optional[logging.Logger] = None,
+        cache_dir: Optional[str] = None,
     ):
         """Initialize the DorkroomClient.
         
@@ -61,9 +78,14 @@ class DorkroomClient:
             max_retries: Maximum number of retry attempts
             transport: Custom HTTP transport (for testing)
             logger: Custom logger instance
+            cache_dir: Directory for caching fetched payloads between runs
+                (e.g. "~/.cache/dorkroom"); caching is disabled when None
         """
         self.base_url = base_url
         self.timeout = timeout
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        # Data files are plain names under base_url, so a prefix concat suffices
+        self._url_prefix = base_url if base_url.endswith("/") else base_url + "/"
 
         # HTTP session with retries
         self.session = requests.Session()
@@ -73,18 +95,20 @@ class DorkroomClient:
             status_forcelist=[502, 503, 504],
             allowed_methods=["GET"],
         )
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+        # One keep-alive pool per host, sized for the concurrent fetches in load_all
+        adapter = HTTPAdapter(
+            max_retries=retries, pool_connections=1, pool_maxsize=len(_DATA_FILES)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # requests already negotiates gzip; identify the client to the server
+        self.session.headers["User-Agent"] = "dorkroom-client"
 
         # Allow injecting a custom transport for testing
         self.transport = transport or self.session
 
         # Logger
         self.logger = logger or logging.getLogger(__name__)
-        if not self.logger.handlers:
-            h = logging.StreamHandler()
-            h.setFormatter(logging.Formatter("%(levelname)s:%(message)s"))
-            self.logger.addHandler(h)
-        self.logger.setLevel(logging.INFO)
 
         # Data storage
         self._films: List[Film] = []
@@ -96,6 +120,14 @@ class DorkroomClient:
         self._film_index: Dict[str, Film] = {}
         self._dev_index: Dict[str, Developer] = {}
         self._comb_index: Dict[str, Combination] = {}
+        self._combs_by_film: Dict[str, List[Combination]] = {}
+        self._combs_by_dev: Dict[str, List[Combination]] = {}
+
+        # Lowercased search text, aligned with the lists above
+        self._film_corpus: List[str] = []
+        self._dev_corpus: List[str] = []
+        self._film_search_blobs: List[str] = []
+        self._dev_search_blobs: List[str] = []
 
         if not FUZZY_AVAILABLE:
             self.logger.warning("No fuzzy library available; fuzzy searches disabled.")
@@ -113,19 +145,88 @@ class DorkroomClient:
             DataFetchError: If HTTP request fails
             DataParseError: If JSON parsing fails
         """
-        url = urljoin(self.base_url, filename)
+        url = self._url_prefix + filename
+        cached = self._read_cache(filename, url)
         try:
             self.logger.debug(f"GET {url}")
-            resp = self.transport.get(url, timeout=self.timeout)
-            resp.raise_for_status()
+            if cached is not None:
+                # Revalidate the cached copy with a conditional GET
+                resp = self.transport.get(url, timeout=self.timeout, headers=cached[1])
+            else:
+                resp = self.transport.get(url, timeout=self.timeout)
+            if cached is not None and resp.status_code == 304:
+                self.logger.debug(f"Using cached {filename}")
+                content = cached[0]
+            else:
+                resp.raise_for_status()
+                content = resp.content
+                self._write_cache(filename, url, content, resp.headers)
         except Exception as e:
             raise DataFetchError(f"Failed to fetch {filename}: {e}") from e
 
         try:
-            return resp.json()
+            return _loads(content)
         except json.JSONDecodeError as e:
             raise DataParseError(f"Invalid JSON in {filename}: {e}") from e
 
+    def _read_cache(self, filename: str, url: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """Read a cached payload and the headers needed to revalidate it.
+        
+        Args:
+            filename: Name of the JSON file
+            url: URL the payload was fetched from
+            
+        Returns:
+            Optional[Tuple[bytes, Dict[str, str]]]: Cached payload and conditional
+            request headers, or None if there is no usable cache entry
+        """
+        if not self.cache_dir:
+            return None
+        path = os.path.join(self.cache_dir, filename)
+        try:
+            with open(path + ".meta", "rb") as f:
+                meta = _loads(f.read())
+            if meta.get("url") != url:
+                return None
+            headers = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            if not headers:
+                return None
+            with open(path, "rb") as f:
+                return f.read(), headers
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, filename: str, url: str, content: bytes, headers: Any) -> None:
+        """Store a fetched payload along with its validators.
+        
+        Args:
+            filename: Name of the JSON file
+            url: URL the payload was fetched from
+            content: Raw response body
+            headers: Response headers
+        """
+        if not self.cache_dir:
+            return
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        path = os.path.join(self.cache_dir, filename)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to temp files first so a crash never leaves a torn entry
+            for target, data in ((path, content), (path + ".meta", json.dumps(meta).encode())):
+                with open(target + ".tmp", "wb") as f:
+                    f.write(data)
+                os.replace(target + ".tmp", target)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache for {filename}: {e}")
+
     def load_all(self) -> None:
         """Fetch and parse all JSON data, building internal indexes.
         
@@ -137,18 +238,39 @@ class DorkroomClient:
             DataFetchError: If any HTTP request fails
             DataParseError: If any JSON parsing fails
         """
-        raw_films = self._fetch("film_stocks.json")
-        raw_devs = self._fetch("developers.json")
-        raw_combos = self._fetch("development_combinations.json")
+        # The three files are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=len(_DATA_FILES)) as pool:
+            raw_films, raw_devs, raw_combos = pool.map(self._fetch, _DATA_FILES)
 
-        self._films = [Film(**f) for f in raw_films]
-        self._devs = [Developer(**d) for d in raw_devs]
-        self._combinations = [Combination(**c) for c in raw_combos]
+        # Drop each decoded payload as soon as its records are built so the
+        # raw dicts and the dataclasses are never all alive at once.
+        self._films = list(map(Film.from_dict, raw_films))
+        del raw_films
+        self._devs = list(map(Developer.from_dict, raw_devs))
+        del raw_devs
+        self._combinations = list(map(Combination.from_dict, raw_combos))
+        del raw_combos
 
         # Build indexes
         self._film_index = {f.id: f for f in self._films}
         self._dev_index = {d.id: d for d in self._devs}
         self._comb_index = {c.id: c for c in self._combinations}
+        self._combs_by_film = {}
+        self._combs_by_dev = {}
+        for c in self._combinations:
+            self._combs_by_film.setdefault(c.filmStockId, []).append(c)
+            self._combs_by_dev.setdefault(c.developerId, []).append(c)
+        self._film_corpus = [
+            f"{f.brand} {f.name} {f.description or ''}".lower() for f in self._films
+        ]
+        self._dev_corpus = [
+            f"{d.manufacturer} {d.name} {d.notes or ''}".lower() for d in self._devs
+        ]
+        # The NUL separator keeps substring matches from spanning both fields
+        self._film_search_blobs = [f"{f.name}\x00{f.brand}".lower() for f in self._films]
+        self._dev_search_blobs = [
+            f"{d.name}\x00{d.manufacturer}".lower() for d in self._devs
+        ]
 
         self._loaded = True
         self.logger.info(
@@ -166,7 +288,6 @@ class DorkroomClient:
         if not self._loaded:
             raise DataNotLoadedError("Call load_all() before using the client.")
 
-    @lru_cache(maxsize=None)
     def get_film(self, film_id: str) -> Optional[Film]:
         """Get a film by its ID.
         
@@ -182,7 +303,6 @@ class DorkroomClient:
         self._ensure_loaded()
         return self._film_index.get(film_id)
 
-    @lru_cache(maxsize=None)
     def get_developer(self, dev_id: str) -> Optional[Developer]:
         """Get a developer by its ID.
         
@@ -211,7 +331,7 @@ class DorkroomClient:
             DataNotLoadedError: If load_all() hasn't been called yet
         """
         self._ensure_loaded()
-        return [c for c in self._combinations if c.filmStockId == film_id]
+        return list(self._combs_by_film.get(film_id, ()))
 
     def list_combinations_for_developer(self, dev_id: str) -> List[Combination]:
         """Get all development combinations for a specific developer.
@@ -226,7 +346,7 @@ class DorkroomClient:
             DataNotLoadedError: If load_all() hasn't been called yet
         """
         self._ensure_loaded()
-        return [c for c in self._combinations if c.developerId == dev_id]
+        return list(self._combs_by_dev.get(dev_id, ()))
 
     def search_films(self, query: str, colorType: Optional[str] = None) -> List[Film]:
         """Search films by name or brand using substring matching.
@@ -244,11 +364,29 @@ class DorkroomClient:
         self._ensure_loaded()
         q = query.lower()
         return [
-            f for f in self._films
-            if (q in f.name.lower() or q in f.brand.lower())
+            f for f, blob in zip(self._films, self._film_search_blobs)
+            if q in blob
             and (colorType is None or f.colorType == colorType)
         ]
 
+    def search_developers(self, query: str) -> List[Developer]:
+        """Search developers by name or manufacturer using substring matching.
+        
+        Args:
+            query: Search term to match against developer name and manufacturer
+            
+        Returns:
+            List[Developer]: List of matching developers
+            
+        Raises:
+            DataNotLoadedError: If load_all() hasn't been called yet
+        """
+        self._ensure_loaded()
+        q = query.lower()
+        return [
+            d for d, blob in zip(self._devs, self._dev_search_blobs) if q in blob
+        ]
+
     def fuzzy_search(
         self,
         items: List[Any],
@@ -272,6 +410,32 @@ class DorkroomClient:
         Returns:
             List[Any]: List of matching items, sorted by relevance score
             
+        Raises:
+            DataNotLoadedError: If load_all() hasn't been called yet
+        """
+        texts = [" ".join([fn(item) for fn in key_funcs]).lower() for item in items]
+        return self._fuzzy_rank(items, texts, query, limit, threshold)
+
+    def _fuzzy_rank(
+        self,
+        items: List[Any],
+        texts: List[str],
+        query: str,
+        limit: int = 10,
+        threshold: float = 60.0,
+    ) -> List[Any]:
+        """Rank items by fuzzy similarity of their precomputed search text.
+        
+        Args:
+            items: List of items to search through
+            texts: Lowercased searchable text for each item, in the same order
+            query: Search query string
+            limit: Maximum number of results to return
+            threshold: Minimum similarity score (0-100) to include in results
+            
+        Returns:
+            List[Any]: List of matching items, sorted by relevance score
+            
         Raises:
             DataNotLoadedError: If load_all() hasn't been called yet
         """
@@ -280,25 +444,28 @@ class DorkroomClient:
             self.logger.warning("Fuzzy search not available; returning simple search.")
             return items[:limit]
 
-        scores = []
         qi = query.lower()
-        for item in items:
-            text = " ".join(fn(item).lower() for fn in key_funcs)
-            # Use token_sort_ratio for primary scoring (handles reordered words well)
-            # But also check partial_ratio for substring matches
-            token_score = fuzz.token_sort_ratio(qi, text)
-            partial_score = fuzz.partial_ratio(qi, text)
-            
+        # Use token_sort_ratio for primary scoring (handles reordered words well)
+        # But also check partial_ratio for substring matches.
+        # Each scorer runs as one batched native pass over the whole corpus.
+        scores = {
+            idx: score
+            for _, score, idx in process.extract(
+                qi, texts, scorer=fuzz.token_sort_ratio, score_cutoff=threshold, limit=None
+            )
+        }
+        for _, partial_score, idx in process.extract(
+            qi, texts, scorer=fuzz.partial_ratio, score_cutoff=80, limit=None
+        ):
             # Weight token_sort_ratio higher, but boost with partial_ratio for substring matches
             if partial_score > 80:  # Strong substring match
-                score = max(token_score, partial_score * 0.9)  # Slight penalty for partial matches
-            else:
-                score = token_score
-                
-            if score >= threshold:
-                scores.append((score, item))
-        scores.sort(reverse=True, key=lambda x: x[0])
-        return [it for _, it in scores[:limit]]
+                score = max(scores.get(idx, 0.0), partial_score * 0.9)  # Slight penalty for partial matches
+                if score >= threshold:
+                    scores[idx] = score
+
+        # Partial sort: only the top `limit` matches are ever returned.
+        ranked = heapq.nlargest(limit, scores, key=lambda idx: (scores[idx], -idx))
+        return [items[idx] for idx in ranked]
 
     def fuzzy_search_films(self, query: str, limit: int = 10) -> List[Film]:
         """Fuzzy search for films by name, brand, and description.
@@ -313,9 +480,9 @@ class DorkroomClient:
         Raises:
             DataNotLoadedError: If load_all() hasn't been called yet
         """
-        return self.fuzzy_search(
+        return self._fuzzy_rank(
             self._films,
-            key_funcs=[lambda f: f"{f.brand} {f.name}", lambda f: f.description or ""],
+            self._film_corpus,
             query=query,
             limit=limit,
         )
@@ -333,9 +500,9 @@ class DorkroomClient:
         Raises:
             DataNotLoadedError: If load_all() hasn't been called yet
         """
-        return self.fuzzy_search(
+        return self._fuzzy_rank(
             self._devs,
-            key_funcs=[lambda d: f"{d.manufacturer} {d.name}", lambda d: d.notes or ""],
+            self._dev_corpus,
             query=query,
             limit=limit,
         ) 
\ No newline at end of file
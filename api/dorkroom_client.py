@@ -28,6 +28,9 @@ from .protocols import HTTPTransport
 
 # Example usage:
 if __name__ == "__main__":
+    import logging
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(message)s")
+
     client = DorkroomClient()
     client.load_all()
 
@@ -5,6 +5,7 @@ formatters.py
 Formatting utilities for the Dorkroom Static API client.
 """
 
+import sys
 from typing import List
 from .types import Film, Developer
 
@@ -69,5 +70,6 @@ class CLIFormatter:
         Args:
             lines: List of strings to print
         """
-        for ln in lines:
-            print(ln) 
\ No newline at end of file
+        # One write per record instead of one print() per line
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n") 
\ No newline at end of file
@@ -5,7 +5,7 @@ protocols.py
 Protocol definitions for the Dorkroom Static API client.
 """
 
-from typing import Protocol
+from typing import Dict, Optional, Protocol
 import requests
 
 
@@ -15,12 +15,16 @@ class HTTPTransport(Protocol):
     This allows for easy testing by injecting mock transports.
     """
     
-    def get(self, url: str, timeout: float) -> requests.Response:
+    def get(
+        self, url: str, timeout: float, headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
         """Perform HTTP GET request.
         
         Args:
             url: The URL to request
             timeout: Request timeout in seconds
+            headers: Optional request headers (used for conditional GETs
+                when the client has a cache directory)
             
         Returns:
             requests.Response: The HTTP response object
@@ -5,11 +5,33 @@ types.py
 Data types and dataclasses for the Dorkroom Static API client.
 """
 
-from dataclasses import dataclass, field
+import re
+import sys
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+
+def _snake_case_aliases(cls):
+    """Add read-only snake_case properties for each camelCase field.
+    
+    The camelCase field names mirror the JSON schema and remain the single
+    source of truth; aliases such as ``film.iso_speed`` simply read them.
+    """
+    for f in fields(cls):
+        alias = _CAMEL_BOUNDARY_RE.sub("_", f.name).lower()
+        if alias != f.name:
+            setattr(cls, alias, property(attrgetter(f.name)))
+    return cls
+
+
+@_snake_case_aliases
+@dataclass(**_DATACLASS_OPTIONS)
 class Film:
     """Represents a film stock with all its properties.
     
@@ -40,8 +62,35 @@ class Film:
     staticImageURL: Optional[str] = None
     dateAdded: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Film":
+        """Build a Film from a raw JSON record without kwargs unpacking.
+        
+        Args:
+            d: Raw record as parsed from film_stocks.json
+            
+        Returns:
+            Film: The constructed film
+        """
+        # Low-cardinality fields are interned so repeated values share one str
+        return cls(
+            d["id"],
+            d["name"],
+            sys.intern(d["brand"]),
+            d["isoSpeed"],
+            sys.intern(d["colorType"]),
+            d.get("description"),
+            d.get("discontinued", 0),
+            d.get("manufacturerNotes", []),
+            d.get("grainStructure"),
+            d.get("reciprocityFailure"),
+            d.get("staticImageURL"),
+            d.get("dateAdded"),
+        )
+
 
-@dataclass
+@_snake_case_aliases
+@dataclass(**_DATACLASS_OPTIONS)
 class Developer:
     """Represents a film/paper developer with all its properties.
     
@@ -74,8 +123,36 @@ class Developer:
     safetyNotes: Optional[str] = None
     datasheetUrl: Optional[List[str]] = None
 
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Developer":
+        """Build a Developer from a raw JSON record without kwargs unpacking.
+        
+        Args:
+            d: Raw record as parsed from developers.json
+            
+        Returns:
+            Developer: The constructed developer
+        """
+        # Low-cardinality fields are interned so repeated values share one str
+        return cls(
+            d["id"],
+            d["name"],
+            sys.intern(d["manufacturer"]),
+            sys.intern(d["type"]),
+            sys.intern(d["filmOrPaper"]),
+            d.get("dilutions", []),
+            d.get("workingLifeHours"),
+            d.get("stockLifeMonths"),
+            d.get("notes"),
+            d.get("discontinued", 0),
+            d.get("mixingInstructions"),
+            d.get("safetyNotes"),
+            d.get("datasheetUrl"),
+        )
 
-@dataclass
+
+@_snake_case_aliases
+@dataclass(**_DATACLASS_OPTIONS)
 class Combination:
     """Represents a film+developer combination with development parameters.
     
@@ -104,4 +181,31 @@ class Combination:
     agitationSchedule: Optional[str] = None
     notes: Optional[str] = None
     dilutionId: Optional[int] = None
-    customDilution: Optional[str] = None 
\ No newline at end of file
+    customDilution: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Combination":
+        """Build a Combination from a raw JSON record without kwargs unpacking.
+        
+        Args:
+            d: Raw record as parsed from development_combinations.json
+            
+        Returns:
+            Combination: The constructed combination
+        """
+        # Film/developer ids repeat across combinations; intern them
+        return cls(
+            d["id"],
+            d["name"],
+            sys.intern(d["filmStockId"]),
+            sys.intern(d["developerId"]),
+            d["temperatureF"],
+            d["timeMinutes"],
+            d["shootingIso"],
+            d.get("pushPull", 0),
+            d.get("agitationSchedule"),
+            d.get("notes"),
+            d.get("dilutionId"),
+            d.get("customDilution"),
+        )
+ 
\ No newline at end of file
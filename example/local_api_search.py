@@ -5,6 +5,7 @@ A command-line tool for locally searching film stocks, developers, and developme
 with fuzzy search capabilities and custom combination management. Does not access the Dorkroom Static API GitHub repository.
 """
 
+import heapq
 import json
 import os
 import sys
@@ -13,6 +14,22 @@ from dataclasses import dataclass
 from datetime import datetime
 import argparse
 
+# Prefer orjson for faster JSON load/save; fall back to the stdlib
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 try:
     from rapidfuzz import fuzz, process
     from tabulate import tabulate
@@ -32,6 +49,32 @@ class SearchResult:
     type: str
 
 
+def _batch_scores(query: str, choices: List[str], scorer) -> List[float]:
+    """Score query against every choice in one rapidfuzz call, indexed like choices"""
+    scores = [0.0] * len(choices)
+    for _, score, idx in process.extract(query, choices, scorer=scorer, limit=None):
+        scores[idx] = score
+    return scores
+
+
+def _info_table(rows: List[List[Any]]) -> str:
+    """Render fixed label/value rows in tabulate's 'grid' layout without tabulate"""
+    # Multi-line cells get one padded line per row, as tabulate does
+    cells = [(str(label).split("\n"), ("" if value is None else str(value).strip()).split("\n"))
+             for label, value in rows]
+    label_width = max(len(line) for label, _ in cells for line in label)
+    value_width = max(len(line) for _, value in cells for line in value)
+    border = f"+{'-' * (label_width + 2)}+{'-' * (value_width + 2)}+"
+    lines = [border]
+    for label, value in cells:
+        for i in range(max(len(label), len(value))):
+            label_line = label[i] if i < len(label) else ""
+            value_line = value[i] if i < len(value) else ""
+            lines.append(f"| {label_line:<{label_width}} | {value_line:<{value_width}} |")
+        lines.append(border)
+    return "\n".join(lines)
+
+
 class DarkroomAPI:
     """Main class for managing darkroom data and search functionality"""
     
@@ -46,211 +89,231 @@ class DarkroomAPI:
         
         self.load_data()
         self.load_custom_combinations()
+        self.build_search_text()
+        self.build_combination_search_text()
     
     def load_data(self):
         """Load all JSON data files"""
         try:
-            with open(os.path.join(self.data_dir, "film_stocks.json"), 'r') as f:
-                self.films = json.load(f)
+            with open(os.path.join(self.data_dir, "film_stocks.json"), 'rb') as f:
+                self.films = _loads(f.read())
+            
+            with open(os.path.join(self.data_dir, "developers.json"), 'rb') as f:
+                self.developers = _loads(f.read())
             
-            with open(os.path.join(self.data_dir, "developers.json"), 'r') as f:
-                self.developers = json.load(f)
+            with open(os.path.join(self.data_dir, "development_combinations.json"), 'rb') as f:
+                self.combinations = _loads(f.read())
             
-            with open(os.path.join(self.data_dir, "development_combinations.json"), 'r') as f:
-                self.combinations = json.load(f)
+            with open(os.path.join(self.data_dir, "formats.json"), 'rb') as f:
+                self.formats = _loads(f.read())
             
-            with open(os.path.join(self.data_dir, "formats.json"), 'r') as f:
-                self.formats = json.load(f)
+            # ID lookup tables; built in reverse so the first record wins on duplicate IDs
+            self._film_by_id = {film['id']: film for film in reversed(self.films)}
+            self._dev_by_id = {dev['id']: dev for dev in reversed(self.developers)}
+            self._dilutions_by_dev = {
+                dev['id']: {d['id']: d for d in reversed(dev.get('dilutions', []))}
+                for dev in reversed(self.developers)
+            }
                 
             print(f"{Fore.GREEN}✓ Loaded {len(self.films)} films, {len(self.developers)} developers, {len(self.combinations)} combinations")
         except FileNotFoundError as e:
             print(f"{Fore.RED}Error loading data files: {e}")
             exit(1)
     
+    def build_search_text(self):
+        """Precompute the lowercased film and developer text used by fuzzy search"""
+        # Primary text (name and brand/manufacturer) is weighted most heavily;
+        # secondary text covers the other searchable attributes
+        self._film_primary = [f"{film['brand']} {film['name']}".lower() for film in self.films]
+        self._film_words = [frozenset(text.split()) for text in self._film_primary]
+        self._film_secondary = []
+        for film in self.films:
+            secondary_text = f"{film['isoSpeed']} {film['colorType']}".lower()
+            if film.get('description'):
+                secondary_text += f" {film['description']}".lower()
+            self._film_secondary.append(secondary_text)
+        
+        self._dev_primary = [f"{dev['name']} {dev['manufacturer']}".lower() for dev in self.developers]
+        self._dev_words = [frozenset(text.split()) for text in self._dev_primary]
+        self._dev_secondary = []
+        for dev in self.developers:
+            secondary_text = f"{dev['type']} {dev['filmOrPaper']}".lower()
+            if dev.get('notes'):
+                secondary_text += f" {dev['notes']}".lower()
+            self._dev_secondary.append(secondary_text)
+    
+    def build_combination_search_text(self):
+        """Precompute the lowercased combination text used by fuzzy search"""
+        self._all_combinations = []
+        self._combo_types = []
+        self._combo_primary = []
+        self._combo_enhanced = []
+        self._combo_secondary = []
+        self._combo_words = []
+        
+        for combo in self.combinations:
+            self.add_combination_search_text(combo, "standard")
+        for combo in self.custom_combinations:
+            self.add_combination_search_text(combo, "custom")
+    
+    def add_combination_search_text(self, combo: Dict, combo_type: str):
+        """Append one combination's search text to the precomputed lists"""
+        # Create primary searchable text (combination name - most important)
+        primary_text = combo['name'].lower()
+        
+        # Create enhanced searchable text with film and developer info
+        enhanced_text = primary_text
+        
+        # Add film info if available
+        if combo.get('filmStockId'):
+            film = self.get_film_by_id(combo['filmStockId'])
+            if film:
+                enhanced_text += f" {film['brand']} {film['name']}".lower()
+        
+        # Add developer info if available
+        if combo.get('developerId'):
+            developer = self.get_developer_by_id(combo['developerId'])
+            if developer:
+                enhanced_text += f" {developer['name']}".lower()
+        
+        # Create secondary searchable text (notes)
+        secondary_text = ""
+        if combo.get('notes'):
+            secondary_text = combo['notes'].lower()
+        
+        self._all_combinations.append(combo)
+        self._combo_types.append(combo_type)
+        self._combo_primary.append(primary_text)
+        self._combo_enhanced.append(enhanced_text)
+        self._combo_secondary.append(secondary_text)
+        self._combo_words.append(frozenset(enhanced_text.split()))
+    
     def load_custom_combinations(self):
         """Load custom combinations from file"""
         if os.path.exists(self.custom_combinations_file):
             try:
-                with open(self.custom_combinations_file, 'r') as f:
-                    self.custom_combinations = json.load(f)
+                with open(self.custom_combinations_file, 'rb') as f:
+                    self.custom_combinations = _loads(f.read())
                 print(f"{Fore.GREEN}✓ Loaded {len(self.custom_combinations)} custom combinations")
             except json.JSONDecodeError:
                 print(f"{Fore.YELLOW}Warning: Could not parse custom combinations file")
                 self.custom_combinations = []
         else:
             self.custom_combinations = []
+        
+        # Highest custom ID so far, advanced as new combinations are created
+        self._max_custom_id = max([c.get('id', 0) for c in self.custom_combinations] + [0])
     
     def save_custom_combinations(self):
         """Save custom combinations to file"""
         try:
-            with open(self.custom_combinations_file, 'w') as f:
-                json.dump(self.custom_combinations, f, indent=2)
+            with open(self.custom_combinations_file, 'wb') as f:
+                f.write(_dumps(self.custom_combinations))
             print(f"{Fore.GREEN}✓ Saved custom combinations to {self.custom_combinations_file}")
         except Exception as e:
             print(f"{Fore.RED}Error saving custom combinations: {e}")
     
-    def fuzzy_search_films(self, query: str, limit: int = 10) -> List[SearchResult]:
-        """Search films using improved fuzzy matching"""
+    def _fuzzy_search_records(self, query: str, limit: int, records: List[Dict],
+                              primary: List[str], words: List[frozenset],
+                              secondary: List[str], record_type: str) -> List[SearchResult]:
+        """Shared film/developer fuzzy matching over precomputed search text"""
         results = []
         query_lower = query.lower()
         
-        for film in self.films:
-            # Create primary searchable text (name and brand - most important)
-            primary_text = f"{film['brand']} {film['name']}".lower()
-            
-            # Create secondary searchable text (other attributes)
-            secondary_text = f"{film['isoSpeed']} {film['colorType']}".lower()
-            if film.get('description'):
-                secondary_text += f" {film['description']}".lower()
-            
-            # Calculate multiple fuzzy scores
-            # 1. Token sort ratio - good for handling word order differences
-            primary_token_score = fuzz.token_sort_ratio(query_lower, primary_text)
-            
-            # 2. Partial ratio - good for substring matches
-            primary_partial_score = fuzz.partial_ratio(query_lower, primary_text)
-            
-            # 3. Ratio - good for overall similarity
-            primary_ratio_score = fuzz.ratio(query_lower, primary_text)
-            
-            # 4. Token set ratio - good for handling extra words
-            primary_token_set_score = fuzz.token_set_ratio(query_lower, primary_text)
-            
-            # Calculate secondary scores (lower weight)
-            secondary_partial_score = fuzz.partial_ratio(query_lower, secondary_text)
+        # Calculate multiple fuzzy scores, one batched call per scorer
+        # 1. Token sort ratio - good for handling word order differences
+        token_scores = _batch_scores(query_lower, primary, fuzz.token_sort_ratio)
+        
+        # 2. Partial ratio - good for substring matches
+        partial_scores = _batch_scores(query_lower, primary, fuzz.partial_ratio)
+        
+        # 3. Ratio - good for overall similarity
+        ratio_scores = _batch_scores(query_lower, primary, fuzz.ratio)
+        
+        # 4. Token set ratio - good for handling extra words
+        token_set_scores = _batch_scores(query_lower, primary, fuzz.token_set_ratio)
+        
+        # Calculate secondary scores (lower weight)
+        secondary_scores = _batch_scores(query_lower, secondary, fuzz.partial_ratio)
+        query_words = query_lower.split()
+        
+        for i, record in enumerate(records):
+            primary_text = primary[i]
+            primary_words = words[i]
             
             # Weighted composite score - prioritize primary text heavily
             composite_score = (
-                primary_token_score * 0.3 +
-                primary_partial_score * 0.25 +
-                primary_ratio_score * 0.2 +
-                primary_token_set_score * 0.15 +
-                secondary_partial_score * 0.1
+                token_scores[i] * 0.3 +
+                partial_scores[i] * 0.25 +
+                ratio_scores[i] * 0.2 +
+                token_set_scores[i] * 0.15 +
+                secondary_scores[i] * 0.1
             )
             
             # Bonus for exact word matches in primary text
-            query_words = query_lower.split()
-            primary_words = primary_text.split()
             exact_word_matches = sum(1 for word in query_words if word in primary_words)
             if exact_word_matches > 0:
                 composite_score += exact_word_matches * 10  # Significant bonus
             
-            # Bonus for matches at the beginning of the name/brand
+            # Bonus for matches at the beginning of the primary text
             if primary_text.startswith(query_lower):
                 composite_score += 15
             elif any(word.startswith(query_lower) for word in primary_words):
                 composite_score += 10
             
             if composite_score > 40:  # Adjusted threshold
-                results.append(SearchResult(film, int(composite_score), "film"))
+                results.append(SearchResult(record, int(composite_score), record_type))
         
-        return sorted(results, key=lambda x: x.score, reverse=True)[:limit]
+        return heapq.nlargest(limit, results, key=lambda x: x.score)
+    
+    def fuzzy_search_films(self, query: str, limit: int = 10) -> List[SearchResult]:
+        """Search films using improved fuzzy matching"""
+        return self._fuzzy_search_records(query, limit, self.films, self._film_primary,
+                                          self._film_words, self._film_secondary, "film")
     
     def fuzzy_search_developers(self, query: str, limit: int = 10) -> List[SearchResult]:
         """Search developers using improved fuzzy matching"""
-        results = []
-        query_lower = query.lower()
-        
-        for dev in self.developers:
-            # Create primary searchable text (name and manufacturer - most important)
-            primary_text = f"{dev['name']} {dev['manufacturer']}".lower()
-            
-            # Create secondary searchable text (other attributes)
-            secondary_text = f"{dev['type']} {dev['filmOrPaper']}".lower()
-            if dev.get('notes'):
-                secondary_text += f" {dev['notes']}".lower()
-            
-            # Calculate multiple fuzzy scores
-            primary_token_score = fuzz.token_sort_ratio(query_lower, primary_text)
-            primary_partial_score = fuzz.partial_ratio(query_lower, primary_text)
-            primary_ratio_score = fuzz.ratio(query_lower, primary_text)
-            primary_token_set_score = fuzz.token_set_ratio(query_lower, primary_text)
-            
-            # Calculate secondary scores (lower weight)
-            secondary_partial_score = fuzz.partial_ratio(query_lower, secondary_text)
-            
-            # Weighted composite score - prioritize primary text heavily
-            composite_score = (
-                primary_token_score * 0.3 +
-                primary_partial_score * 0.25 +
-                primary_ratio_score * 0.2 +
-                primary_token_set_score * 0.15 +
-                secondary_partial_score * 0.1
-            )
-            
-            # Bonus for exact word matches in primary text
-            query_words = query_lower.split()
-            primary_words = primary_text.split()
-            exact_word_matches = sum(1 for word in query_words if word in primary_words)
-            if exact_word_matches > 0:
-                composite_score += exact_word_matches * 10
-            
-            # Bonus for matches at the beginning of the name/manufacturer
-            if primary_text.startswith(query_lower):
-                composite_score += 15
-            elif any(word.startswith(query_lower) for word in primary_words):
-                composite_score += 10
-            
-            if composite_score > 40:
-                results.append(SearchResult(dev, int(composite_score), "developer"))
-        
-        return sorted(results, key=lambda x: x.score, reverse=True)[:limit]
+        return self._fuzzy_search_records(query, limit, self.developers, self._dev_primary,
+                                          self._dev_words, self._dev_secondary, "developer")
     
     def fuzzy_search_combinations(self, query: str, limit: int = 10) -> List[SearchResult]:
         """Search development combinations using improved fuzzy matching"""
         results = []
         query_lower = query.lower()
-        all_combinations = self.combinations + self.custom_combinations
-        
-        for combo in all_combinations:
-            # Create primary searchable text (combination name - most important)
-            primary_text = combo['name'].lower()
-            
-            # Create enhanced searchable text with film and developer info
-            enhanced_text = primary_text
-            
-            # Add film info if available
-            if combo.get('filmStockId'):
-                film = self.get_film_by_id(combo['filmStockId'])
-                if film:
-                    enhanced_text += f" {film['brand']} {film['name']}".lower()
-            
-            # Add developer info if available
-            if combo.get('developerId'):
-                developer = self.get_developer_by_id(combo['developerId'])
-                if developer:
-                    enhanced_text += f" {developer['name']}".lower()
-            
-            # Create secondary searchable text (notes)
-            secondary_text = ""
-            if combo.get('notes'):
-                secondary_text = combo['notes'].lower()
-            
-            # Calculate multiple fuzzy scores
-            primary_token_score = fuzz.token_sort_ratio(query_lower, primary_text)
-            primary_partial_score = fuzz.partial_ratio(query_lower, primary_text)
-            primary_ratio_score = fuzz.ratio(query_lower, primary_text)
-            
-            # Enhanced text scores (includes film/developer names)
-            enhanced_partial_score = fuzz.partial_ratio(query_lower, enhanced_text)
-            enhanced_token_score = fuzz.token_sort_ratio(query_lower, enhanced_text)
-            
-            # Secondary scores
-            secondary_partial_score = fuzz.partial_ratio(query_lower, secondary_text) if secondary_text else 0
+        all_combinations = self._all_combinations
+        primary_texts = self._combo_primary
+        enhanced_texts = self._combo_enhanced
+        secondary_texts = self._combo_secondary
+        
+        # Calculate multiple fuzzy scores, one batched call per scorer
+        token_scores = _batch_scores(query_lower, primary_texts, fuzz.token_sort_ratio)
+        partial_scores = _batch_scores(query_lower, primary_texts, fuzz.partial_ratio)
+        ratio_scores = _batch_scores(query_lower, primary_texts, fuzz.ratio)
+        
+        # Enhanced text scores (includes film/developer names)
+        enhanced_partial_scores = _batch_scores(query_lower, enhanced_texts, fuzz.partial_ratio)
+        enhanced_token_scores = _batch_scores(query_lower, enhanced_texts, fuzz.token_sort_ratio)
+        
+        # Secondary scores
+        secondary_scores = _batch_scores(query_lower, secondary_texts, fuzz.partial_ratio)
+        query_words = query_lower.split()
+        
+        for i, combo in enumerate(all_combinations):
+            primary_text = primary_texts[i]
+            enhanced_text = enhanced_texts[i]
+            enhanced_words = self._combo_words[i]
             
             # Weighted composite score
             composite_score = (
-                primary_token_score * 0.25 +
-                primary_partial_score * 0.2 +
-                primary_ratio_score * 0.15 +
-                enhanced_partial_score * 0.2 +
-                enhanced_token_score * 0.15 +
-                secondary_partial_score * 0.05
+                token_scores[i] * 0.25 +
+                partial_scores[i] * 0.2 +
+                ratio_scores[i] * 0.15 +
+                enhanced_partial_scores[i] * 0.2 +
+                enhanced_token_scores[i] * 0.15 +
+                (secondary_scores[i] if secondary_texts[i] else 0) * 0.05
             )
             
             # Bonus for exact word matches
-            query_words = query_lower.split()
-            enhanced_words = enhanced_text.split()
             exact_word_matches = sum(1 for word in query_words if word in enhanced_words)
             if exact_word_matches > 0:
                 composite_score += exact_word_matches * 8
@@ -262,10 +325,9 @@ class DarkroomAPI:
                 composite_score += 8
             
             if composite_score > 35:
-                combo_type = "custom" if combo in self.custom_combinations else "standard"
-                results.append(SearchResult(combo, int(composite_score), combo_type))
+                results.append(SearchResult(combo, int(composite_score), self._combo_types[i]))
         
-        return sorted(results, key=lambda x: x.score, reverse=True)[:limit]
+        return heapq.nlargest(limit, results, key=lambda x: x.score)
     
     def search_all(self, query: str, limit: int = 5) -> Dict[str, List[SearchResult]]:
         """Search across all categories"""
@@ -277,11 +339,15 @@ class DarkroomAPI:
     
     def get_film_by_id(self, film_id: int) -> Optional[Dict]:
         """Get film by ID"""
-        return next((f for f in self.films if f['id'] == film_id), None)
+        return self._film_by_id.get(film_id)
     
     def get_developer_by_id(self, dev_id: int) -> Optional[Dict]:
         """Get developer by ID"""
-        return next((d for d in self.developers if d['id'] == dev_id), None)
+        return self._dev_by_id.get(dev_id)
+    
+    def get_dilution_by_id(self, dev_id: int, dilution_id: int) -> Optional[Dict]:
+        """Get one of a developer's dilutions by ID"""
+        return self._dilutions_by_dev.get(dev_id, {}).get(dilution_id)
     
     def create_custom_combination(self, name: str, film_stock_id: int, developer_id: int, 
                                 dilution_id: int, temperature_f: float, time_minutes: float,
@@ -298,13 +364,13 @@ class DarkroomAPI:
             raise ValueError(f"Developer with ID {developer_id} not found")
         
         # Find the dilution
-        dilution = next((d for d in developer['dilutions'] if d['id'] == dilution_id), None)
+        dilution = self.get_dilution_by_id(developer_id, dilution_id)
         if not dilution:
             raise ValueError(f"Dilution with ID {dilution_id} not found for developer {developer['name']}")
         
         # Generate new ID
-        max_id = max([c.get('id', 0) for c in self.custom_combinations] + [0])
-        new_id = max_id + 1
+        self._max_custom_id += 1
+        new_id = self._max_custom_id
         
         custom_combo = {
             "id": new_id,
@@ -322,6 +388,7 @@ class DarkroomAPI:
         }
         
         self.custom_combinations.append(custom_combo)
+        self.add_combination_search_text(custom_combo, "custom")
         self.save_custom_combinations()
         
         return custom_combo
@@ -344,7 +411,7 @@ class DarkroomDisplay:
             ["Status", "Discontinued" if film.get('discontinued', 0) else "Available"]
         ]
         
-        print(f"{Fore.WHITE}{tabulate(basic_info, tablefmt='grid')}")
+        print(f"{Fore.WHITE}{_info_table(basic_info)}")
         
         if show_details and film.get('description'):
             print(f"\n{Fore.YELLOW}Description:")
@@ -369,7 +436,7 @@ class DarkroomDisplay:
             ["Status", "Discontinued" if developer.get('discontinued', 0) else "Available"]
         ]
         
-        print(f"{Fore.WHITE}{tabulate(basic_info, tablefmt='grid')}")
+        print(f"{Fore.WHITE}{_info_table(basic_info)}")
         
         if developer.get('dilutions'):
             print(f"\n{Fore.YELLOW}Available Dilutions:")
@@ -402,7 +469,7 @@ class DarkroomDisplay:
         # Find dilution name
         dilution_name = "Unknown"
         if developer and combo.get('dilutionId'):
-            dilution = next((d for d in developer['dilutions'] if d['id'] == combo['dilutionId']), None)
+            dilution = api.get_dilution_by_id(developer['id'], combo['dilutionId'])
             if dilution:
                 dilution_name = f"{dilution['name']} ({dilution['dilution']})"
         
@@ -419,7 +486,7 @@ class DarkroomDisplay:
         if combo_type == "custom" and combo.get('createdDate'):
             combo_info.append(["Created", combo['createdDate'][:10]])
         
-        print(f"{Fore.WHITE}{tabulate(combo_info, tablefmt='grid')}")
+        print(f"{Fore.WHITE}{_info_table(combo_info)}")
         
         if combo.get('notes'):
             print(f"\n{Fore.YELLOW}Notes:")
@@ -471,10 +538,28 @@ class InteractiveInterface:
         self.api = api
         self.display = DarkroomDisplay()
         self.running = True
+        # Main menu options, keyed by the number the user enters
+        self._menu = {
+            1: lambda: self.search_interface("all"),
+            2: lambda: self.search_interface("film"),
+            3: lambda: self.search_interface("developer"),
+            4: lambda: self.search_interface("combination"),
+            5: self.show_item_interface,
+            6: self.list_items_interface,
+            7: self.create_combination_interface,
+            8: self.show_help,
+            9: self.quit,
+        }
     
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Legacy Windows consoles may not understand ANSI; everything else
+        # gets the escape sequence rather than spawning a `clear` process
+        if os.name == 'nt' and not os.environ.get('WT_SESSION'):
+            os.system('cls')
+        else:
+            sys.stdout.write('\x1b[2J\x1b[H')
+            sys.stdout.flush()
     
     def show_header(self):
         """Display the application header"""
@@ -719,7 +804,7 @@ class InteractiveInterface:
             return
         
         # Validate dilution exists
-        dilution = next((d for d in developer['dilutions'] if d['id'] == dilution_id), None)
+        dilution = self.api.get_dilution_by_id(developer_id, dilution_id)
         if not dilution:
             print(f"{Fore.RED}Dilution with ID {dilution_id} not found")
             self.wait_for_enter()
@@ -784,6 +869,11 @@ class InteractiveInterface:
         
         self.wait_for_enter()
     
+    def quit(self):
+        """Leave the interactive loop"""
+        self.running = False
+        print(f"\n{Fore.GREEN}Thanks for using Darkroom Search Tool! 📸")
+    
     def run(self):
         """Main interactive loop"""
         try:
@@ -794,25 +884,9 @@ class InteractiveInterface:
                 
                 choice = self.get_user_input("Select option (1-9)", int)
                 
-                if choice == 1:
-                    self.search_interface("all")
-                elif choice == 2:
-                    self.search_interface("film")
-                elif choice == 3:
-                    self.search_interface("developer")
-                elif choice == 4:
-                    self.search_interface("combination")
-                elif choice == 5:
-                    self.show_item_interface()
-                elif choice == 6:
-                    self.list_items_interface()
-                elif choice == 7:
-                    self.create_combination_interface()
-                elif choice == 8:
-                    self.show_help()
-                elif choice == 9:
-                    self.running = False
-                    print(f"\n{Fore.GREEN}Thanks for using Darkroom Search Tool! 📸")
+                action = self._menu.get(choice)
+                if action:
+                    action()
                 else:
                     print(f"{Fore.RED}Invalid choice. Please select 1-9.")
                     self.wait_for_enter()
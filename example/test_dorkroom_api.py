@@ -4,17 +4,23 @@ Test script for pulling and working with data from the Dorkroom Static API
 Repository: https://github.com/narrowstacks/dorkroom-static-api
 """
 
+from __future__ import annotations
+
 import sys
-import code
 import argparse
+import logging
+from collections import Counter
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from dataclasses import dataclass
 
 # Add the parent directory to the Python path to import from api module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from api.dorkroom_client import DorkroomClient, CLIFormatter, Film, Developer, Combination
+# The client pulls in requests and rapidfuzz; import it only once it is
+# needed so that `--help` and argument errors return immediately
+if TYPE_CHECKING:
+    from api.dorkroom_client import Film, Developer, Combination
 
 
 @dataclass
@@ -27,14 +33,18 @@ class SearchResult:
 class DorkroomAPIWrapper:
     """Wrapper around DorkroomClient to maintain compatibility with existing test code"""
     
-    def __init__(self):
-        self.client = DorkroomClient()
+    def __init__(self, cache_dir: Optional[str] = None):
+        from api.dorkroom_client import DorkroomClient, CLIFormatter
+        
+        self.client = DorkroomClient(cache_dir=cache_dir)
         self.formatter = CLIFormatter()
         self._loaded = False
+        self._brand_counts: Counter = Counter()
     
     def load_all_data(self):
         """Load all data - wrapper around client.load_all()"""
         self.client.load_all()
+        self._brand_counts = Counter(f.brand for f in self.client._films)
         self._loaded = True
     
     @property
@@ -62,12 +72,8 @@ class DorkroomAPIWrapper:
         return self.client.search_films(query, colorType)
     
     def search_developers(self, query: str) -> List[Developer]:
-        """Search developers - implementing since it doesn't exist in new client"""
-        q = query.lower()
-        return [
-            d for d in self.client._devs
-            if (q in d.name.lower() or q in d.manufacturer.lower())
-        ]
+        """Search developers using the new client"""
+        return self.client.search_developers(query)
     
     def fuzzy_search_films(self, query: str, limit: int = 10, colorType: Optional[str] = None) -> List[SearchResult]:
         """Fuzzy search films with compatibility wrapper"""
@@ -96,6 +102,14 @@ class DorkroomAPIWrapper:
         """Get combinations for a film"""
         return self.client.list_combinations_for_film(film_id)
     
+    def get_combinations_for_developer(self, dev_id: str) -> List[Combination]:
+        """Get combinations for a developer"""
+        return self.client.list_combinations_for_developer(dev_id)
+    
+    def brand_counts(self) -> Counter:
+        """Number of film stocks per brand, built once at load time"""
+        return self._brand_counts
+    
     def display_film_info(self, film: Film):
         """Display film information using CLIFormatter"""
         lines = self.formatter.format_film(film)
@@ -138,6 +152,8 @@ class DorkroomAPIWrapper:
     
     def display_search_results(self, results: List[SearchResult]):
         """Display fuzzy search results"""
+        from api.dorkroom_client import Film, Developer
+        
         for i, result in enumerate(results, 1):
             print(f"\n{i}. Score: {result.score:.1f}")
             if isinstance(result.item, Film):
@@ -258,11 +274,17 @@ def run_sample_queries(api: DorkroomAPIWrapper):
     
     # Sample 5: Show statistics
     print(f"\n5. 📊 Database Statistics:")
+    # Gather every film statistic in a single pass
     total_films = len(api.film_stocks)
-    active_films = len([f for f in api.film_stocks if f.discontinued == 0])
-    bw_films = len([f for f in api.film_stocks if f.colorType == 'bw'])
-    color_films = len([f for f in api.film_stocks if f.colorType == 'color'])
-    slide_films = len([f for f in api.film_stocks if f.colorType == 'slide'])
+    active_films = 0
+    type_counts = Counter()
+    for f in api.film_stocks:
+        if f.discontinued == 0:
+            active_films += 1
+        type_counts[f.colorType] += 1
+    bw_films = type_counts['bw']
+    color_films = type_counts['color']
+    slide_films = type_counts['slide']
     
     print(f"   📷 Film Stocks: {total_films} total ({active_films} active)")
     print(f"      • Black & White: {bw_films}")
@@ -274,11 +296,10 @@ def run_sample_queries(api: DorkroomAPIWrapper):
     
     # Sample 6: Show film brands
     if api.film_stocks:
-        brands = set(film.brand for film in api.film_stocks)
+        brands = api.brand_counts()
         print(f"\n6. 🏭 Available Film Brands ({len(brands)}):")
         for brand in sorted(brands)[:10]:  # Show first 10
-            brand_count = len([f for f in api.film_stocks if f.brand == brand])
-            print(f"   • {brand}: {brand_count} films")
+            print(f"   • {brand}: {brands[brand]} films")
         if len(brands) > 10:
             print(f"   ... and {len(brands) - 10} more brands")
             
@@ -292,6 +313,7 @@ def run_sample_queries(api: DorkroomAPIWrapper):
 
 def start_interactive_mode(api: DorkroomAPIWrapper):
     """Start interactive Python shell with API client available"""
+    import code
     
     # Create helpful shortcuts
     films = api.film_stocks
@@ -417,14 +439,20 @@ def main():
                        help='Skip demo queries and go straight to interactive mode')
     parser.add_argument('--no-interactive', action='store_true',
                        help='Skip interactive mode after demo')
+    parser.add_argument('--cache-dir', default='~/.cache/dorkroom',
+                       help="Directory for cached API payloads, revalidated with ETags "
+                            "(default: ~/.cache/dorkroom; pass '' to disable)")
     args = parser.parse_args()
     
+    # Show the client's load summary and warnings on the console
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(message)s")
+    
     print("Dorkroom Static API Test Script")
     print("Repository: https://github.com/narrowstacks/dorkroom-static-api")
     print("=" * 60)
     
     # Initialize API client wrapper
-    api = DorkroomAPIWrapper()
+    api = DorkroomAPIWrapper(cache_dir=args.cache_dir or None)
     
     try:
         # Load all data